@@ -1,15 +1,18 @@
 import re
 from agents.base_agent import BaseAgent
-from utils.config_manager import load_config
+from utils.config_manager import load_config, compile_evaluation
 
 
 class EvaluationAgent(BaseAgent):
     """Evaluate articles against selection criteria."""
 
     def __init__(self, config=None):
-        cfg = load_config().get("evaluation", {})
+        # Copied because compile_evaluation and update() write into it
+        cfg = dict(load_config().get("evaluation", {}))
         if config:
             cfg.update(config)
+        if config or "_roi_re" not in cfg:
+            compile_evaluation(cfg)
         super().__init__(cfg)
         self.companies = cfg.get("companies", [])
         self.tools = cfg.get("tools", [])
@@ -30,6 +33,13 @@ class EvaluationAgent(BaseAgent):
             "major_platforms",
             ["openai", "microsoft", "google", "amazon", "meta"],
         )
+        self._roi_re = cfg["_roi_re"]
+        self._promo_re = cfg["_promo_re"]
+        self._companies_re = cfg["_companies_re"]
+        self._tools_re = cfg["_tools_re"]
+        self._retail_terms_re = cfg["_retail_terms_re"]
+        self._deployment_terms_re = cfg["_deployment_terms_re"]
+        self._major_platforms_re = cfg["_major_platforms_re"]
 
     def evaluate(self, articles):
         evaluated = []
@@ -39,10 +49,26 @@ class EvaluationAgent(BaseAgent):
             evaluated.append(article)
         return evaluated
 
-    def _find_entity(self, text):
-        for name in self.companies:
+    @staticmethod
+    def _first_listed(names, pattern, text):
+        """Return the first of ``names`` (in list order) found in ``text``.
+
+        ``pattern`` matches any of the names and screens out the common
+        no-match case in one scan. Its matches are not used directly, since
+        overlapping names (e.g. "Google" and "Google Cloud") only yield the
+        longest one.
+        """
+        if not pattern.search(text):
+            return None
+        for name in names:
             if re.search(rf"\b{re.escape(name)}\b", text, re.IGNORECASE):
                 return name
+        return None
+
+    def _find_entity(self, text):
+        name = self._first_listed(self.companies, self._companies_re, text)
+        if name:
+            return name
         # Look for government agencies and other organizations
         match = re.search(r"\b([A-Z][A-Za-z&]+(?:\s+[A-Z][A-Za-z&]+){0,3})\b", text)
         if match:
@@ -50,9 +76,9 @@ class EvaluationAgent(BaseAgent):
         return None
 
     def _find_tool(self, text):
-        for name in self.tools:
-            if re.search(rf"\b{re.escape(name)}\b", text, re.IGNORECASE):
-                return name
+        name = self._first_listed(self.tools, self._tools_re, text)
+        if name:
+            return name
         if re.search(r"generative ai|large language model|llm", text, re.IGNORECASE):
             return "Generative AI"
         return None
@@ -98,7 +124,7 @@ class EvaluationAgent(BaseAgent):
             })
 
         # Criterion 3: Measurable ROI/Business impact
-        if re.search(self.roi_pattern, text_lower) and any(term in text_lower for term in ["revenue", "sales", "cost", "efficiency", "productivity"]):
+        if self._roi_re.search(text_lower) and any(term in text_lower for term in ["revenue", "sales", "cost", "efficiency", "productivity"]):
             criteria.append({
                 "criteria": "Measurable ROI / Business impact",
                 "status": True,
@@ -113,7 +139,7 @@ class EvaluationAgent(BaseAgent):
             })
 
         # Criterion 4: Retail/E-commerce relevance
-        retail_relevance = any(term in text_lower for term in self.retail_terms)
+        retail_relevance = bool(self._retail_terms_re.search(text_lower))
         if retail_relevance:
             criteria.append({
                 "criteria": "Relevance to retail priorities",
@@ -129,7 +155,7 @@ class EvaluationAgent(BaseAgent):
             })
 
         # Criterion 5: Neutral tone
-        promotional = re.search(self.promotional_pattern, text_lower)
+        promotional = self._promo_re.search(text_lower)
         if not promotional:
             criteria.append({
                 "criteria": "Neutral tone",
@@ -145,7 +171,7 @@ class EvaluationAgent(BaseAgent):
             })
 
         # Criterion 6: Concrete implementation vs fluff
-        if any(t in text_lower for t in self.deployment_terms):
+        if self._deployment_terms_re.search(text_lower):
             criteria.append({
                 "criteria": "Not customer-service or visionary fluff",
                 "status": True,
@@ -161,7 +187,7 @@ class EvaluationAgent(BaseAgent):
 
         # Criterion 7: Major platform impact
         platform_impact = False
-        if any(p in text_lower for p in self.major_platforms) and re.search(r"retail|commerce|shopping|marketplace", text_lower):
+        if self._major_platforms_re.search(text_lower) and re.search(r"retail|commerce|shopping|marketplace", text_lower):
             platform_impact = True
             criteria.append({
                 "criteria": "OpenAI / Microsoft / Google release impact",
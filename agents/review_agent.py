@@ -14,9 +14,11 @@ class ReviewAgent:
         csv_path = os.path.join(self.report_dir, "ai_news_report.csv")
 
         # Generate PDF report
-        generate_pdf_report(selected_articles, pdf_path)
-        
+        with open(pdf_path, "wb") as pdf_file:
+            generate_pdf_report(selected_articles, out=pdf_file)
+
         # Generate CSV report
-        generate_csv_report(selected_articles, csv_path)
+        with open(csv_path, "wb") as csv_file:
+            generate_csv_report(selected_articles, out=csv_file)
 
         return pdf_path, csv_path
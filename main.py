@@ -7,6 +7,7 @@ from utils.report_tools import (
     generate_pdf_report,
     generate_csv_report,
     generate_excel_report,
+    prepare_report_rows,
     sort_by_assessment_and_score,
 )
 from utils.simple_particles import add_simple_particles
@@ -312,8 +313,6 @@ def main():
         if fetch_button:
             # First hide settings panel
             st.session_state.show_settings = False
-            # Close the drawer via query param so it disappears on rerun
-            st.query_params["close_settings"] = "1"
             # Then reset state for a new scan
             st.session_state.is_fetching = True
             st.session_state.pdf_data = None
@@ -384,9 +383,10 @@ def main():
 
                 # Generate reports and store them in session state
                 if st.session_state.articles:
-                    st.session_state.pdf_data = generate_pdf_report(st.session_state.current_articles)
-                    st.session_state.csv_data = generate_csv_report(st.session_state.current_articles)
-                    st.session_state.excel_data = generate_excel_report(st.session_state.current_articles)
+                    report_rows = prepare_report_rows(st.session_state.current_articles)
+                    st.session_state.pdf_data = generate_pdf_report(report_rows, prepared=True)
+                    st.session_state.csv_data = generate_csv_report(report_rows, prepared=True)
+                    st.session_state.excel_data = generate_excel_report(report_rows, prepared=True)
 
                 # Show completion message and stats
                 end_time = datetime.now()
@@ -82,3 +82,25 @@ def test_analyzer_uses_config_rubric(monkeypatch):
         {"takeaway": "b", "key_points": []},
     ])
     assert "RUBRIC_TWO" in captured["prompt"]
+
+
+def test_evaluation_agent_term_scanning():
+    from agents.evaluation_agent import EvaluationAgent
+
+    agent = EvaluationAgent(config={
+        "companies": ["Target", "Walmart"],
+        "tools": ["ChatGPT", "Claude"],
+    })
+    text = "Walmart rolled out Claude and ChatGPT; Target followed"
+    assert agent._find_entity(text) == "Target"
+    assert agent._find_tool(text) == "ChatGPT"
+    assert agent._find_tool("ChatGPTs everywhere") is None
+
+    # Overlapping names still resolve in list order
+    agent = EvaluationAgent(config={"companies": ["Google", "Google Cloud"]})
+    assert agent._find_entity("Google Cloud launched a model") == "Google"
+
+    result = agent.evaluate_article({"title": "Walmart deployed ChatGPT", "content": "retail sales"})
+    statuses = {c["criteria"]: c["status"] for c in result["criteria_results"]}
+    assert statuses["Relevance to retail priorities"]
+    assert statuses["Not customer-service or visionary fluff"]
@@ -3,6 +3,7 @@ from unittest.mock import patch, Mock
 from datetime import datetime
 import os
 import sys
+import tempfile
 import types
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -12,6 +13,7 @@ requests_mod = types.ModuleType('requests')
 class _Response:
     status_code = 200
     text = ''
+    content = b''
     def raise_for_status(self):
         pass
 class _ReqEx(Exception):
@@ -34,8 +36,8 @@ import utils.search_tools as st
 
 
 class TestSearchTools(unittest.TestCase):
-    @patch('utils.search_tools.requests.get')
-    def test_search_arxiv(self, mock_get):
+    @patch('utils.search_tools._get_session')
+    def test_search_arxiv(self, mock_session):
         xml = '''<feed xmlns="http://www.w3.org/2005/Atom">
             <entry>
                 <title>AI Paper</title>
@@ -44,8 +46,8 @@ class TestSearchTools(unittest.TestCase):
                 <summary>summary text</summary>
             </entry>
         </feed>'''
-        mock_resp = Mock(status_code=200, text=xml)
-        mock_get.return_value = mock_resp
+        mock_resp = Mock(status_code=200, content=xml.encode('utf-8'))
+        mock_session.return_value.get.return_value = mock_resp
 
         cutoff = datetime(2024, 6, 15)
         results = st.search_arxiv(cutoff)
@@ -53,6 +55,36 @@ class TestSearchTools(unittest.TestCase):
         self.assertEqual(results[0]['title'], 'AI Paper')
         self.assertEqual(results[0]['source'], 'arXiv')
 
+    @patch('utils.search_tools.get_article_content', side_effect=lambda url: f'body of {url}')
+    @patch('utils.search_tools.SerpAPIClient')
+    def test_search_web(self, mock_client_cls, _mock_content):
+        responses = {
+            'ai news': {'news_results': [
+                {'title': 'New', 'link': 'http://a', 'source': 'S', 'date': '2024-06-20'},
+                {'title': 'Old', 'link': 'http://b', 'source': 'S', 'date': '2024-06-01'},
+            ]},
+            'ml news': {'news_results': [
+                {'title': 'Other', 'link': 'http://c', 'source': 'S', 'date': '2024-06-18'},
+            ]},
+            'llm news': {'news_results': [
+                {'title': 'No source', 'link': 'http://d', 'date': '2024-06-19'},
+            ]},
+        }
+        mock_client_cls.return_value.search.side_effect = lambda params: responses[params['q']]
+
+        results = st.search_web(['ai', 'ml', 'llm'], datetime(2024, 6, 15))
+        self.assertEqual([r['url'] for r in results], ['http://a', 'http://c'])
+        self.assertEqual(results[1]['content'], 'body of http://c')
+
+    def test_get_article_content_cache(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(st, 'CONTENT_CACHE_DIR', tmp), \
+                patch.object(st.trafilatura, 'fetch_url', create=True, return_value='<html/>') as fetch, \
+                patch.object(st.trafilatura, 'extract', create=True, return_value='text'):
+            self.assertEqual(st.get_article_content('http://a'), 'text')
+            self.assertEqual(st.get_article_content('http://a'), 'text')
+            self.assertEqual(fetch.call_count, 1)
+
 
 if __name__ == '__main__':
     unittest.main()
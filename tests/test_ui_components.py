@@ -0,0 +1,92 @@
+import pytest
+
+pytest.importorskip("streamlit.testing.v1")
+from streamlit.testing.v1 import AppTest
+
+
+def _drawer_app():
+    import streamlit as st
+    from utils.ui_components import render_settings_drawer
+
+    st.session_state.setdefault("show_settings", True)
+    fetch_requested, _ = render_settings_drawer()
+    # Mirrors main.py: hide the drawer, rerun, then scan on the next run
+    if fetch_requested:
+        st.session_state.show_settings = False
+        st.session_state.is_fetching = True
+        st.rerun()
+    if st.session_state.is_fetching:
+        st.session_state.fetched_with = (
+            st.session_state.test_mode,
+            st.session_state.time_value,
+            st.session_state.time_unit,
+        )
+        st.session_state.is_fetching = False
+
+
+def test_settings_drawer_configuration_section():
+    at = AppTest.from_function(_drawer_app).run()
+    assert not at.exception
+
+    at.toggle(key="_cfg_open").set_value(True).run()
+    assert not at.exception
+    assert len(at.text_area) == 8
+    assert [b.label for b in at.button if b.label.startswith("Save")] == [
+        "Save Evaluation Configuration",
+        "Save URL Configuration",
+    ]
+
+
+def test_settings_drawer_fetch_keeps_user_settings():
+    at = AppTest.from_function(_drawer_app).run()
+    at.toggle(key="_test_mode_widget").set_value(True)
+    at.number_input(key="_time_value_widget").set_value(3)
+    at.selectbox(key="_time_unit_widget").set_value("Days").run()
+
+    at.button(key="fetch_btn").click().run()
+    assert not at.exception
+    assert at.session_state.fetched_with == (True, 3, "Days")
+    assert at.session_state.lookback_days == 3
+    assert not at.session_state.show_settings
+
+
+
+def test_settings_drawer_close_keeps_user_settings():
+    at = AppTest.from_function(_drawer_app).run()
+    at.toggle(key="_test_mode_widget").set_value(True)
+    at.number_input(key="_time_value_widget").set_value(3).run()
+
+    at.button(key="close_drawer").click().run()
+    assert not at.exception
+    assert not at.session_state.show_settings
+    assert at.session_state.test_mode is True
+
+    at.session_state.show_settings = True
+    at.run()
+    assert at.toggle(key="_test_mode_widget").value is True
+    assert at.number_input(key="_time_value_widget").value == 3
+
+def test_settings_drawer_save_leaves_cached_config_untouched(tmp_path, monkeypatch):
+    import json
+    from utils import config_manager
+
+    cfg_file = tmp_path / "config.json"
+    monkeypatch.setattr(config_manager, "CONFIG_PATH", str(cfg_file))
+    monkeypatch.setattr(config_manager, "DEFAULT_CONFIG_PATH", str(tmp_path / "config.default.json"))
+    cfg_file.write_text(json.dumps({
+        "evaluation": {"companies": ["Target"]},
+        "full_scan_urls": ["https://a"],
+    }))
+    cached = config_manager.load_config()
+
+    at = AppTest.from_function(_drawer_app).run()
+    at.toggle(key="_cfg_open").set_value(True).run()
+    at.text_area[0].input("Target, Walmart")
+    save = next(b for b in at.button if b.label == "Save Evaluation Configuration")
+    save.click().run()
+    assert not at.exception
+
+    saved = json.loads(cfg_file.read_text())
+    assert saved["evaluation"]["companies"] == ["Target", "Walmart"]
+    assert saved["full_scan_urls"] == ["https://a"]
+    assert cached["evaluation"]["companies"] == ["Target"]
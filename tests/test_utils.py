@@ -12,14 +12,15 @@ sys.modules.setdefault("bs4", types.SimpleNamespace(BeautifulSoup=object))
 sys.modules.setdefault("requests", types.SimpleNamespace(get=lambda *a, **k: None, Response=type("Response", (), {})))
 
 from datetime import datetime
+from io import BytesIO
 import json
 import os
-import sqlite3
+import threading
 import time
 
 import pytest
 
-from utils import common, config_manager, content_extractor, ai_analyzer, db_manager
+from utils import common, config_manager, content_extractor, ai_analyzer, db_manager, report_tools
 
 
 def test_format_date():
@@ -64,6 +65,42 @@ def test_config_manager_reset(tmp_path, monkeypatch):
     assert json.loads(cfg_file.read_text()) == {"orig": 1}
 
 
+def test_config_manager_load_cache(tmp_path, monkeypatch):
+    cfg_file = tmp_path / "config.json"
+    monkeypatch.setattr(config_manager, "CONFIG_PATH", str(cfg_file))
+    monkeypatch.setattr(config_manager, "DEFAULT_CONFIG_PATH", str(tmp_path / "config.default.json"))
+    cfg_file.write_text(json.dumps({"items": [1]}))
+
+    first = config_manager.load_config()
+    assert first == {"items": [1]}
+    # Unchanged file: the cached dict itself is returned
+    assert config_manager.load_config() is first
+
+    config_manager.save_config({"items": [3]})
+    assert config_manager.load_config() == {"items": [3]}
+
+
+def test_config_manager_compiled_evaluation(tmp_path, monkeypatch):
+    cfg_file = tmp_path / "config.json"
+    monkeypatch.setattr(config_manager, "CONFIG_PATH", str(cfg_file))
+    monkeypatch.setattr(config_manager, "DEFAULT_CONFIG_PATH", str(tmp_path / "config.default.json"))
+    cfg_file.write_text(json.dumps({"evaluation": {
+        "tools": ["ChatGPT"], "roi_pattern": "saved", "major_platforms": ["OpenAI"],
+    }}))
+
+    cfg = config_manager.load_config()
+    eval_cfg = cfg["evaluation"]
+    assert eval_cfg["_roi_re"].search("We SAVED money")
+    assert eval_cfg["_tools_re"].search("Using chatgpt daily")
+    assert eval_cfg["_major_platforms_re"].search("OPENAI shipped")
+
+    config_manager.save_config(cfg)
+    saved = json.loads(cfg_file.read_text())
+    assert saved["evaluation"] == {
+        "tools": ["ChatGPT"], "roi_pattern": "saved", "major_platforms": ["OpenAI"],
+    }
+
+
 def test_clean_article_title():
     assert content_extractor.clean_article_title("Permalink to Test") == "Test"
     assert content_extractor.clean_article_title("Normal Title") == "Normal Title"
@@ -90,14 +127,9 @@ def test_split_into_chunks():
     assert all(len(c) <= 3000 for c in chunks)
 
 
-def test_db_manager_in_memory(monkeypatch):
-    def dummy_init(self):
-        self.conn = sqlite3.connect(":memory:")
-        self.local = types.SimpleNamespace(conn=self.conn)
-        self.create_tables()
-
-    monkeypatch.setattr(db_manager.DBManager, "__init__", dummy_init, raising=False)
-    db = db_manager.DBManager()
+def test_db_manager_in_memory():
+    # A :memory: manager shares one connection whatever the pool size
+    db = db_manager.DBManager(":memory:")
     article = {
         "url": "http://example.com",
         "title": "Title",
@@ -111,6 +143,75 @@ def test_db_manager_in_memory(monkeypatch):
     assert len(rows) == 1
     assert rows[0]["url"] == "http://example.com"
 
+    db.save_articles([
+        {"url": f"http://example.com/{i}", "title": "T", "date": "2024-01-02"}
+        for i in range(3)
+    ])
+    assert len(db.get_articles()) == 4
+    assert len(list(db.iter_articles(limit=2, batch_size=1))) == 2
+
+
+def test_db_manager_nested_borrow(tmp_path, monkeypatch):
+    db = db_manager.DBManager(str(tmp_path / "articles.db"), pool_size=1)
+    db.save_articles([
+        {"url": f"http://example.com/{i}", "title": "T", "date": "2024-01-02"}
+        for i in range(3)
+    ])
+    # Saving while iterating reuses the connection the iterator holds
+    for row in db.iter_articles(batch_size=1):
+        db.save_article({**row, "summary": "updated"})
+    assert {row["summary"] for row in db.get_articles()} == {"updated"}
+
+    # Another thread times out instead of blocking while this one holds it
+    monkeypatch.setattr(db_manager, "POOL_TIMEOUT", 0.01)
+    errors = []
+
+    def borrow():
+        try:
+            with db.connection():
+                pass
+        except RuntimeError as e:
+            errors.append(e)
+
+    with db.connection():
+        worker = threading.Thread(target=borrow)
+        worker.start()
+        worker.join()
+    assert len(errors) == 1
+
+
+def test_db_manager_generator_closed_on_other_thread(tmp_path, monkeypatch):
+    db = db_manager.DBManager(str(tmp_path / "articles.db"), pool_size=1)
+    db.save_article({"url": "http://example.com", "title": "T", "date": "2024-01-02"})
+
+    rows = db.iter_articles(batch_size=1)
+    next(rows)
+    closer = threading.Thread(target=rows.close)
+    closer.start()
+    closer.join()
+
+    # Another thread now holds the connection the generator gave back
+    holding, release = threading.Event(), threading.Event()
+
+    def hold():
+        with db.connection():
+            holding.set()
+            release.wait()
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    holding.wait()
+    try:
+        # This thread must not reuse it; it waits on the pool and times out
+        monkeypatch.setattr(db_manager, "POOL_TIMEOUT", 0.01)
+        with pytest.raises(RuntimeError):
+            with db.connection():
+                pass
+    finally:
+        release.set()
+        holder.join()
+    assert len(db.get_articles()) == 1
+
 
 def test_get_takeaway_rubric_reload(tmp_path, monkeypatch):
     cfg_file = tmp_path / "config.json"
@@ -133,3 +234,68 @@ def test_get_takeaway_rubric_reload(tmp_path, monkeypatch):
     os.utime(cfg_file, None)
     updated = ai_analyzer._get_takeaway_rubric()
     assert updated == "updated"
+
+
+REPORT_ARTICLES = [
+    {
+        "title": "Cut, but \"quoted\"",
+        "url": "https://example.com/cut",
+        "date": "2024-01-01",
+        "category": "Ops",
+        "takeaway": "Line one\nline two",
+        "assessment": "CUT",
+        "assessment_score": 90,
+    },
+    {
+        "title": "Included",
+        "url": "file:///C:/saved/https://example.com/a%20b",
+        "date": "2024-01-02",
+        "category": "Retail",
+        "takeaway": "Short",
+        "category_justification": "Fits",
+        "assessment": "INCLUDE",
+        "assessment_score": 50,
+        "criteria_results": [{"criteria": "C1", "status": True, "notes": "n"}],
+    },
+]
+
+
+def test_generate_csv_report():
+    data = report_tools.generate_csv_report(REPORT_ARTICLES)
+    assert data == (
+        "Use Case Category,URL,Title,Takeaway,Date,Use Case Category Justification\n"
+        "Retail,https://example.com/a b,Included,Short,2024-01-02,Fits\n"
+        'Ops,https://example.com/cut,"Cut, but ""quoted""","Line one\nline two",2024-01-01,N/A\n'
+    ).encode("utf-8")
+    assert report_tools.generate_csv_report([]) == b""
+
+
+def test_generate_excel_report():
+    from openpyxl import load_workbook
+
+    data = report_tools.generate_excel_report(REPORT_ARTICLES)
+    sheet = load_workbook(BytesIO(data))["AI News"]
+    rows = list(sheet.iter_rows(values_only=True))
+    assert rows[0] == tuple(report_tools.EXCEL_COLUMNS)
+    assert rows[1] == ("Retail", "https://example.com/a b", "Included", "Short", "2024-01-02")
+    assert rows[2][2] == 'Cut, but "quoted"'
+    assert all(cell.font.bold for cell in sheet[1])
+    # Widest value (or header) in each column plus two
+    assert [sheet.column_dimensions[c].width for c in "ABCDE"] == [19, 25, 19, 19, 12]
+
+
+def test_generate_reports_to_file_object():
+    rows = report_tools.prepare_report_rows(REPORT_ARTICLES)
+    for generate in (
+        report_tools.generate_csv_report,
+        report_tools.generate_excel_report,
+        report_tools.generate_pdf_report,
+    ):
+        out = BytesIO()
+        assert generate(rows, out=out, prepared=True) is None
+        # Written to, but the caller's file object is left open
+        assert not out.closed
+        assert out.getvalue()
+        if generate is report_tools.generate_csv_report:
+            assert out.getvalue() == generate(rows, prepared=True)
+    assert report_tools.generate_pdf_report(rows, prepared=True).startswith(b"%PDF")
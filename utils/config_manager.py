@@ -1,9 +1,14 @@
+import copy
 import json
 import os
+import re
 
 CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config.json")
 DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config.default.json")
 
+# Parsed config keyed by path and modification time to skip re-reading disk
+_CACHE = {"path": None, "mtime": None, "data": None}
+
 DEFAULT_CONFIG = {
     "evaluation": {
         "companies": [
@@ -77,32 +82,100 @@ def archive_default_config():
     """Archive the original default configuration for reset purposes."""
     if not os.path.exists(DEFAULT_CONFIG_PATH):
         with open(DEFAULT_CONFIG_PATH, "w", encoding="utf-8") as f:
-            json.dump(DEFAULT_CONFIG, f, indent=2)
+            f.write(json.dumps(DEFAULT_CONFIG, indent=2))
+
+
+def _term_pattern(terms, word_boundary: bool = False):
+    """Compile ``terms`` into one case-insensitive alternation regex."""
+    alternatives = sorted({re.escape(t) for t in terms if t}, key=len, reverse=True)
+    if not alternatives:
+        return re.compile(r"(?!)")
+    pattern = "|".join(alternatives)
+    if word_boundary:
+        pattern = rf"\b(?:{pattern})\b"
+    return re.compile(pattern, re.I)
+
+
+def compile_evaluation(eval_cfg: dict) -> dict:
+    """Attach precompiled patterns to ``eval_cfg``.
+
+    Derived entries use a leading underscore and are dropped by
+    ``save_config`` so they never reach disk.
+    """
+    defaults = DEFAULT_CONFIG["evaluation"]
+    eval_cfg["_roi_re"] = re.compile(
+        eval_cfg.get("roi_pattern", defaults["roi_pattern"]), re.I
+    )
+    eval_cfg["_promo_re"] = re.compile(
+        eval_cfg.get("promotional_pattern", defaults["promotional_pattern"]), re.I
+    )
+    # One alternation per term list so each article is scanned once per list
+    for key in ("tools", "companies"):
+        eval_cfg[f"_{key}_re"] = _term_pattern(
+            eval_cfg.get(key, defaults[key]), word_boundary=True
+        )
+    for key in ("retail_terms", "deployment_terms", "major_platforms"):
+        eval_cfg[f"_{key}_re"] = _term_pattern(eval_cfg.get(key, defaults[key]))
+    return eval_cfg
+
+
+def _default_config() -> dict:
+    """Return a private, compiled copy of ``DEFAULT_CONFIG``."""
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    compile_evaluation(config["evaluation"])
+    return config
+
+
+def _invalidate_cache():
+    """Force the next ``load_config`` call to re-read the file."""
+    _CACHE["mtime"] = None
 
 
 def load_config():
-    """Load configuration from disk or return defaults."""
-    archive_default_config()
-    if os.path.exists(CONFIG_PATH):
-        try:
-            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return DEFAULT_CONFIG.copy()
+    """Load configuration from disk or return defaults.
+
+    The parsed file is cached until its modification time changes. Callers
+    share the cached dict, so copy it before mutating.
+    """
+    if _CACHE["data"] is None:
+        archive_default_config()
+    try:
+        mtime = os.stat(CONFIG_PATH).st_mtime_ns
+    except OSError:
+        return _default_config()
+
+    if _CACHE["path"] == CONFIG_PATH and _CACHE["mtime"] == mtime:
+        return _CACHE["data"]
+
+    try:
+        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+            data = json.loads(f.read())
+    except Exception:
+        return _default_config()
+
+    if isinstance(data.get("evaluation"), dict):
+        compile_evaluation(data["evaluation"])
+    _CACHE.update(path=CONFIG_PATH, mtime=mtime, data=data)
+    return data
 
 
 def save_config(config: dict):
     """Save configuration to disk."""
+    if isinstance(config.get("evaluation"), dict):
+        config = dict(config)
+        config["evaluation"] = {
+            k: v for k, v in config["evaluation"].items() if not k.startswith("_")
+        }
     with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
+        f.write(json.dumps(config, indent=2))
+    _invalidate_cache()
 
 
 def reset_config() -> dict:
     """Restore configuration from archived defaults and return it."""
     if os.path.exists(DEFAULT_CONFIG_PATH):
         with open(DEFAULT_CONFIG_PATH, "r", encoding="utf-8") as f:
-            defaults = json.load(f)
+            defaults = json.loads(f.read())
     else:
         defaults = DEFAULT_CONFIG.copy()
     save_config(defaults)
@@ -1,43 +1,103 @@
-
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
 import json
+import queue
 import threading
 
+# Applied to every new connection: WAL lets readers run alongside the writer
+# and NORMAL sync only fsyncs at checkpoints instead of on every commit.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+GET_ARTICLES_SQL = 'SELECT * FROM articles ORDER BY created_at DESC LIMIT ?'
+
+# Upper bound on open connections shared by all threads using one manager
+POOL_SIZE = 8
+
+# Seconds to wait for a free pooled connection before giving up
+POOL_TIMEOUT = 30
+
 class DBManager:
-    def __init__(self):
-        self.db_path = 'articles.db'
-        self.local = threading.local()
+    def __init__(self, db_path='articles.db', pool_size=POOL_SIZE):
+        self.db_path = db_path
+        # Every ":memory:" connection opens its own empty database, so only
+        # a single shared connection sees the tables
+        if db_path == ':memory:':
+            pool_size = 1
+        self._pool = queue.Queue(maxsize=pool_size)
+        # Connection currently borrowed by each thread, keyed by thread ident
+        self._held = {}
+        for _ in range(pool_size):
+            self._pool.put(self._connect())
         self.create_tables()
-        
-    def get_connection(self):
-        """Get a thread-local database connection"""
-        if not hasattr(self.local, 'conn'):
-            self.local.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        return self.local.conn
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled connection, blocking until one is free
+
+        A thread that already holds a connection (e.g. saving while looping
+        over iter_articles) reuses it rather than waiting on the pool.
+        """
+        owner = threading.get_ident()
+        conn = self._held.get(owner)
+        if conn is not None:
+            yield conn
+            return
+        try:
+            conn = self._pool.get(timeout=POOL_TIMEOUT)
+        except queue.Empty:
+            raise RuntimeError(
+                f"No database connection became free within {POOL_TIMEOUT}s"
+            )
+        self._held[owner] = conn
+        try:
+            yield conn
+        finally:
+            # A generator may be closed on another thread, so release the
+            # borrowing thread's entry rather than the current thread's
+            del self._held[owner]
+            self._pool.put(conn)
         
     def create_tables(self):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS articles (
-                url TEXT PRIMARY KEY,
-                title TEXT,
-                date TEXT,
-                content TEXT,
-                summary TEXT,
-                ai_validation TEXT,
-                category TEXT,
-                category_justification TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS articles (
+                    url TEXT PRIMARY KEY,
+                    title TEXT,
+                    date TEXT,
+                    content TEXT,
+                    summary TEXT,
+                    ai_validation TEXT,
+                    category TEXT,
+                    category_justification TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            self._add_column_if_not_exists(cursor, 'articles', 'category', 'TEXT')
+            self._add_column_if_not_exists(cursor, 'articles', 'category_justification', 'TEXT')
+            cursor.execute(
+                'CREATE INDEX IF NOT EXISTS idx_articles_created_at '
+                'ON articles(created_at DESC)'
             )
-        ''')
-        self._add_column_if_not_exists('articles', 'category', 'TEXT')
-        self._add_column_if_not_exists('articles', 'category_justification', 'TEXT')
-        conn.commit()
+            conn.commit()
 
-    def _add_column_if_not_exists(self, table_name, column_name, column_type):
-        cursor = self.get_connection().cursor()
+    def _add_column_if_not_exists(self, cursor, table_name, column_name, column_type):
         cursor.execute(f"PRAGMA table_info({table_name})")
         columns = [info[1] for info in cursor.fetchall()]
         if column_name not in columns:
@@ -45,36 +105,58 @@ class DBManager:
                 cursor.execute(
                     f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}"
                 )
-                self.get_connection().commit()
+                cursor.connection.commit()
             except Exception:
                 pass
         
     def save_article(self, article):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT OR REPLACE INTO articles (
-                url, title, date, content, summary, ai_validation,
-                category, category_justification
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            article['url'],
-            article['title'],
-            article['date'],
-            article.get('content', ''),
-            article.get('summary', ''),
-            article.get('ai_validation', ''),
-            article.get('category'),
-            article.get('category_justification')
-        ))
-        conn.commit()
+        self.save_articles([article])
+
+    def save_articles(self, articles):
+        """Insert or replace many articles in a single transaction."""
+        rows = [
+            (
+                article['url'],
+                article['title'],
+                article['date'],
+                article.get('content', ''),
+                article.get('summary', ''),
+                article.get('ai_validation', ''),
+                article.get('category'),
+                article.get('category_justification')
+            )
+            for article in articles
+        ]
+        if not rows:
+            return
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('BEGIN')
+            try:
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO articles (
+                        url, title, date, content, summary, ai_validation,
+                        category, category_justification
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', rows)
+            except Exception:
+                conn.rollback()
+                raise
+            conn.commit()
         
+    def iter_articles(self, limit=None, batch_size=1000):
+        """Yield article rows as dicts, newest first, fetching in batches."""
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            # A negative LIMIT means "no limit" in SQLite, keeping one statement
+            cursor.execute(GET_ARTICLES_SQL, (limit if limit else -1,))
+            columns = [description[0] for description in cursor.description]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(zip(columns, row))
+
     def get_articles(self, limit=None):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        query = 'SELECT * FROM articles ORDER BY created_at DESC'
-        if limit:
-            query += f' LIMIT {limit}'
-        cursor.execute(query)
-        columns = [description[0] for description in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        return list(self.iter_articles(limit))
@@ -10,42 +10,78 @@ from reportlab.platypus import (
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from urllib.parse import unquote
-from io import BytesIO
+from io import BytesIO, StringIO, TextIOWrapper
+import csv
 import os
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime
-import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 from openpyxl.utils import get_column_letter
 
 ASSESSMENT_PRIORITY = {"INCLUDE": 0, "OK": 1, "CUT": 2}
+ASSESSMENT_COLORS = {"INCLUDE": "green", "OK": "orange", "CUT": "red"}
 
 
 def sort_by_assessment_and_score(articles):
     """Sort articles by assessment category and score."""
-    return sorted(
-        articles,
-        key=lambda a: (
-            ASSESSMENT_PRIORITY.get(a.get("assessment", "CUT"), 2),
-            -a.get("assessment_score", 0),
-        ),
-    )
-
-def generate_pdf_report(articles):
-    """Generate a detailed PDF report including evaluation info."""
-    if not articles:
-        return b""
+    # Decorate once so the dict lookups run per article, not per comparison
+    keyed = [
+        (
+            (
+                ASSESSMENT_PRIORITY.get(a.get("assessment", "CUT"), 2),
+                -a.get("assessment_score", 0),
+            ),
+            a,
+        )
+        for a in articles
+    ]
+    keyed.sort(key=itemgetter(0))
+    return [a for _, a in keyed]
+
+def _normalize_url(url):
+    """Strip local file prefixes from saved pages and unquote the URL."""
+    if 'file:///' in url:
+        url = url.split('https://')[-1]
+        url = f'https://{url}'
+    return unquote(url)
+
+
+def prepare_report_rows(articles):
+    """Sort articles and normalize their URLs once for all report writers.
+
+    Pass the result to the ``generate_*_report`` functions with
+    ``prepared=True`` to skip repeating this work in each of them.
+    """
+    rows = []
+    for article in sort_by_assessment_and_score(articles):
+        row = dict(article)
+        row['url'] = _normalize_url(article.get('url', ''))
+        rows.append(row)
+    return rows
+
+
+# Shared by every criteria table; per-row status colors are appended to a copy
+_BASE_TABLE_STYLE = (
+    ('BACKGROUND', (0, 0), (-1, 0), colors.whitesmoke),
+    ('GRID', (0, 0), (-1, -1), 0.25, colors.grey),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+    ('FONTNAME', (1, 1), (1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (1, 1), (1, -1), 12),
+)
 
-    articles = sort_by_assessment_and_score(articles)
 
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter)
+@lru_cache(maxsize=None)
+def _report_styles():
+    """Build the sample stylesheet and takeaway style once per process."""
     styles = getSampleStyleSheet()
-
-    title_style = styles['Heading1']
-    subtitle_style = styles['Heading2']
-    normal_style = styles['Normal']
     takeaway_style = ParagraphStyle(
         'TakeawayStyle',
-        parent=normal_style,
+        parent=styles['Normal'],
         leftIndent=20,
         rightIndent=20,
         spaceAfter=12,
@@ -56,151 +92,188 @@ def generate_pdf_report(articles):
         borderRadius=5,
         backColor=colors.lightgrey,
     )
+    return styles, takeaway_style
+
+
+def generate_pdf_report(articles, out=None, *, prepared=False):
+    """Generate a detailed PDF report including evaluation info.
+
+    When ``out`` is a binary file object the PDF is written to it and
+    ``None`` is returned; otherwise the PDF bytes are returned.
+    """
+    if not prepared:
+        articles = prepare_report_rows(articles)
+    if not articles:
+        return None if out is not None else b""
+
+    buffer = out if out is not None else BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    styles, takeaway_style = _report_styles()
+
+    title_style = styles['Heading1']
+    subtitle_style = styles['Heading2']
+    normal_style = styles['Normal']
 
     content = []
+    add = content.extend
     today = datetime.now().strftime("%Y-%m-%d")
-    content.append(Paragraph(f"AI News Report - {today}", title_style))
-    content.append(Spacer(1, 12))
-    content.append(Paragraph(f"Top {len(articles)} AI Articles", subtitle_style))
-    content.append(Spacer(1, 24))
+    add((
+        Paragraph(f"AI News Report - {today}", title_style),
+        Spacer(1, 12),
+        Paragraph(f"Top {len(articles)} AI Articles", subtitle_style),
+        Spacer(1, 24),
+    ))
 
     for i, article in enumerate(articles, 1):
         title = article.get('title', 'Untitled')
-        url = article.get('url', '')
-        if 'file:///' in url:
-            url = url.split('https://')[-1]
-            url = f'https://{url}'
-        url = unquote(url)
-        content.append(Paragraph(f"{i}. <a href='{url}'>{title}</a>", subtitle_style))
-        content.append(Spacer(1, 2))
-
+        url = article['url']
         date = article.get('date', 'Unknown date')
-        content.append(Paragraph(f"Published: {date} | Source: {url}", normal_style))
-        content.append(Spacer(1, 4))
-
         category = article.get('category', 'N/A')
-        content.append(Paragraph(f"<b>Use Case Category:</b> {category}", normal_style))
-        content.append(Spacer(1, 2))
-
         assessment = article.get('assessment', 'N/A')
         score = article.get('assessment_score', 0)
-        color_map = {"INCLUDE": "green", "OK": "orange", "CUT": "red"}
-        color = color_map.get(assessment.upper(), "black")
-        content.append(Paragraph(
-            f"<b>Assessment:</b> <font color='{color}'>{assessment}</font> (Score: {score}%)",
-            normal_style,
-        ))
-
-        content.append(Spacer(1, 6))
-
+        color = ASSESSMENT_COLORS.get(assessment.upper(), "black")
         takeaway = article.get('takeaway', 'No takeaway available')
-        content.append(Paragraph(f"<b>Key Takeaway:</b> {takeaway}", takeaway_style))
+
+        # Metadata lines share one Paragraph to keep the flowable count low
+        add((
+            Paragraph(f"{i}. <a href='{url}'>{title}</a>", subtitle_style),
+            Spacer(1, 2),
+            Paragraph(
+                f"Published: {date} | Source: {url}<br/>"
+                f"<b>Use Case Category:</b> {category}<br/>"
+                f"<b>Assessment:</b> <font color='{color}'>{assessment}</font> (Score: {score}%)",
+                normal_style,
+            ),
+            Spacer(1, 6),
+            Paragraph(f"<b>Key Takeaway:</b> {takeaway}", takeaway_style),
+        ))
 
         crit_results = article.get('criteria_results', [])
         if crit_results:
             table_data = [["Criteria", "Status", "Notes"]]
-            table_styles = [
-                ('BACKGROUND', (0, 0), (-1, 0), colors.whitesmoke),
-                ('GRID', (0, 0), (-1, -1), 0.25, colors.grey),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('FONTSIZE', (0, 0), (-1, -1), 8),
-                ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-                ('FONTNAME', (1, 1), (1, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (1, 1), (1, -1), 12),
-            ]
-
-            for idx, crit in enumerate(crit_results, 1):
-                status = "✓" if crit.get('status') else "✗"
+            table_styles = list(_BASE_TABLE_STYLE)
+            for crit in crit_results:
                 table_data.append([
                     crit.get('criteria', ''),
-                    status,
+                    "✓" if crit.get('status') else "✗",
                     crit.get('notes', '')
                 ])
-                # Add color style for each row's status cell individually
-                if crit.get('status'):
-                    table_styles.append(('TEXTCOLOR', (1, idx), (1, idx), colors.green))
-                else:
-                    table_styles.append(('TEXTCOLOR', (1, idx), (1, idx), colors.red))
+            # Color each row's status cell individually
+            table_styles.extend(
+                ('TEXTCOLOR', (1, idx), (1, idx), colors.green if crit.get('status') else colors.red)
+                for idx, crit in enumerate(crit_results, 1)
+            )
 
             table = Table(table_data, colWidths=[2.5 * inch, 0.6 * inch, 3.9 * inch])
             table.setStyle(TableStyle(table_styles))
-            content.append(table)
-            content.append(Spacer(1, 6))
+            add((table, Spacer(1, 6)))
 
         justification = article.get('category_justification', 'N/A')
-        content.append(Paragraph(f"<b>Use Case Category Justification:</b> {justification}", normal_style))
-
-        content.append(Spacer(1, 20))
+        add((
+            Paragraph(f"<b>Use Case Category Justification:</b> {justification}", normal_style),
+            Spacer(1, 20),
+        ))
 
     doc.build(content)
+    if out is not None:
+        return None
     pdf_data = buffer.getvalue()
     buffer.close()
     return pdf_data
 
-def generate_csv_report(articles):
-    """Generate a CSV report including evaluation info."""
-    if not articles:
-        return b""
+CSV_FIELDNAMES = [
+    'Use Case Category',
+    'URL',
+    'Title',
+    'Takeaway',
+    'Date',
+    'Use Case Category Justification',
+]
 
-    articles = sort_by_assessment_and_score(articles)
 
-    output = BytesIO()
-    data = []
-    for article in articles:
-        url = article.get('url', '')
-        if 'file:///' in url:
-            url = url.split('https://')[-1]
-            url = f'https://{url}'
-        url = unquote(url)
+def generate_csv_report(articles, out=None, *, prepared=False):
+    """Generate a CSV report including evaluation info.
 
-        row = {
+    ``articles`` may be any iterable, e.g. ``DBManager.iter_articles()``.
+    ``out`` behaves as in ``generate_pdf_report``.
+    """
+    if not prepared:
+        articles = prepare_report_rows(articles)
+    if not articles:
+        return None if out is not None else b""
+
+    if out is not None:
+        output = TextIOWrapper(out, encoding='utf-8', newline='')
+    else:
+        output = StringIO()
+    writer = csv.DictWriter(output, fieldnames=CSV_FIELDNAMES, lineterminator='\n')
+    writer.writeheader()
+    for article in articles:
+        writer.writerow({
             'Use Case Category': article.get('category', 'N/A'),
-            'URL': url,
+            'URL': article['url'],
             'Title': article.get('title', ''),
             'Takeaway': article.get('takeaway', ''),
             'Date': article.get('date', ''),
             'Use Case Category Justification': article.get('category_justification', 'N/A'),
-        }
-        data.append(row)
+        })
 
-    df = pd.DataFrame(data)
-    df.to_csv(output, index=False)
-    return output.getvalue()
+    if out is not None:
+        # Hand the caller's file back open rather than closing it with the wrapper
+        output.flush()
+        output.detach()
+        return None
+    return output.getvalue().encode('utf-8')
 
-def generate_excel_report(articles):
-    """Generate an Excel report including evaluation info."""
-    if not articles:
-        return b""
+EXCEL_COLUMNS = ['Use Case Category', 'URL', 'Title', 'Takeaway', 'Date']
+_HEADER_FONT = Font(bold=True)
 
-    articles = sort_by_assessment_and_score(articles)
 
-    output = BytesIO()
-    data = []
-    for article in articles:
-        url = article.get('url', '')
-        if 'file:///' in url:
-            url = url.split('https://')[-1]
-            url = f'https://{url}'
-        url = unquote(url)
+def generate_excel_report(articles, out=None, *, prepared=False):
+    """Generate an Excel report including evaluation info.
 
-        row = {
-            'Use Case Category': article.get('category', 'N/A'),
-            'URL': url,
-            'Title': article.get('title', ''),
-            'Takeaway': article.get('takeaway', ''),
-            'Date': article.get('date', ''),
-        }
-        data.append(row)
-
-    df = pd.DataFrame(data)
-
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, index=False, sheet_name='AI News')
-        worksheet = writer.sheets['AI News']
-        for idx, col in enumerate(df.columns):
-            max_length = max(df[col].astype(str).apply(len).max(), len(col)) + 2
-            worksheet.column_dimensions[get_column_letter(idx + 1)].width = max_length
+    ``out`` behaves as in ``generate_pdf_report``.
+    """
+    if not prepared:
+        articles = prepare_report_rows(articles)
+    if not articles:
+        return None if out is not None else b""
 
+    rows = []
+    # Column widths are tracked while building rows to avoid a second pass
+    max_len = [len(col) for col in EXCEL_COLUMNS]
+    for article in articles:
+        row = (
+            article.get('category', 'N/A'),
+            article['url'],
+            article.get('title', ''),
+            article.get('takeaway', ''),
+            article.get('date', ''),
+        )
+        rows.append(row)
+        for idx, value in enumerate(row):
+            max_len[idx] = max(max_len[idx], len(str(value)))
+
+    # Write-only mode streams rows to the file instead of keeping a Cell per
+    # value; column widths must be set before the first row is appended.
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet('AI News')
+    for idx, width in enumerate(max_len, 1):
+        worksheet.column_dimensions[get_column_letter(idx)].width = width + 2
+
+    header = []
+    for col in EXCEL_COLUMNS:
+        cell = WriteOnlyCell(worksheet, value=col)
+        cell.font = _HEADER_FONT
+        header.append(cell)
+    worksheet.append(header)
+    for row in rows:
+        worksheet.append(row)
+    if out is not None:
+        workbook.save(out)
+        return None
+    output = BytesIO()
+    workbook.save(output)
     return output.getvalue()
 
 def save_reports(pdf_data, csv_data, excel_data, report_dir):
@@ -214,4 +287,4 @@ def save_reports(pdf_data, csv_data, excel_data, report_dir):
     with open(csv_path, "wb") as csv_file:
         csv_file.write(csv_data)
     with open(excel_path, "wb") as excel_file:
-        excel_file.write(excel_data)
\ No newline at end of file
+        excel_file.write(excel_data)
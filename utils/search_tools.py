@@ -1,41 +1,90 @@
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from serpapi import Client as SerpAPIClient
 from datetime import datetime
+from io import BytesIO
 import xml.etree.ElementTree as ET
 import trafilatura
+import hashlib
 import os
+import threading
+import time
 
-def search_web(keywords, cutoff_date):
+CONTENT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), ".cache", "articles"
+)
+CONTENT_CACHE_TTL = 24 * 60 * 60
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+ATOM_ENTRY_TAG = f"{{{ATOM_NS}}}entry"
+
+# Lazily initialized HTTP session shared by all requests from this module
+_session = None
+
+
+def _get_session():
+    """Return a pooled keep-alive session with light retrying."""
+    global _session
+    if _session is None:
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+    return _session
+
+def search_web(keywords, cutoff_date, max_workers=8):
     """
     Searches for articles using SerpAPI
+
+    Keyword searches and article downloads are network bound, so both run
+    on a thread pool.
     """
-    articles = []
     api_key = os.environ.get("SERPAPI_API_KEY")
     client = SerpAPIClient(api_key=api_key)
+    c_date = cutoff_date.date() if isinstance(cutoff_date, datetime) else cutoff_date
 
-    for keyword in keywords:
+    def search_keyword(keyword):
         params = {
             "engine": "google",
             "q": f"{keyword} news",
             "tbm": "nws",
         }
-
+        found = []
         try:
             results = client.search(params).get("news_results", [])
 
             for result in results:
                 pub_date = datetime.strptime(result['date'], '%Y-%m-%d').date()
-                c_date = cutoff_date.date() if isinstance(cutoff_date, datetime) else cutoff_date
                 if pub_date >= c_date:
-                    articles.append({
+                    found.append({
                         'title': result['title'],
                         'url': result['link'],
                         'source': result['source'],
                         'published_date': pub_date,
-                        'content': get_article_content(result['link'])
                     })
         except Exception as e:
             print(f"Error searching for keyword {keyword}: {str(e)}")
+        return found
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        articles = [
+            article
+            for found in executor.map(search_keyword, keywords)
+            for article in found
+        ]
+        contents = executor.map(
+            get_article_content, [article['url'] for article in articles]
+        )
+        for article, content in zip(articles, contents):
+            article['content'] = content
 
     return articles
 
@@ -53,12 +102,13 @@ def search_arxiv(cutoff_date):
     }
 
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = _get_session().get(url, params=params, timeout=10)
         response.raise_for_status()
-        root = ET.fromstring(response.text)
-
-        ns = {"a": "http://www.w3.org/2005/Atom"}
-        for entry in root.findall("a:entry", ns):
+        ns = {"a": ATOM_NS}
+        # Stream entries and free each one once read instead of holding the DOM
+        for _, entry in ET.iterparse(BytesIO(response.content)):
+            if entry.tag != ATOM_ENTRY_TAG:
+                continue
             title = entry.findtext("a:title", default="", namespaces=ns).strip()
             link = entry.findtext("a:id", default="", namespaces=ns).strip()
             date_text = entry.findtext("a:published", default="", namespaces=ns)
@@ -78,6 +128,7 @@ def search_arxiv(cutoff_date):
                     "published_date": datetime.combine(pub_date, datetime.min.time()),
                     "content": summary,
                 })
+            entry.clear()
     except Exception as e:
         print(f"Error searching arXiv: {str(e)}")
 
@@ -103,13 +154,39 @@ def scrape_website(url, source_name, cutoff_date):
 
     return articles
 
+def _content_cache_path(url):
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(CONTENT_CACHE_DIR, key[:2], key)
+
+
 def get_article_content(url):
     """
     Extracts content from article URL
+
+    Extracted text is cached on disk for ``CONTENT_CACHE_TTL`` seconds so
+    repeated lookups of the same link skip the download.
     """
+    path = _content_cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) < CONTENT_CACHE_TTL:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+    except OSError:
+        pass
+
     try:
         downloaded = trafilatura.fetch_url(url)
         content = trafilatura.extract(downloaded)
-        return content or ""
     except Exception:
         return ""
+
+    if content:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+    return content or ""
@@ -1,189 +1,176 @@
 import streamlit as st
 from utils.common import calculate_lookback_days
+from utils.config_manager import load_config, save_config
 
 
-def _close_settings_param_check():
-    """Check query params to determine if the settings drawer should be closed."""
-    params = st.query_params  # newer API
-    if params.get("close_settings") == "1":
-        st.session_state.show_settings = False
-        if "close_settings" in params:
-            del st.query_params["close_settings"]
+_UNIT_OPTIONS = ("Days", "Weeks")
 
 
-def render_settings_drawer():
-    """Render a slide-out settings drawer and return button states."""
-    _close_settings_param_check()
-    st.markdown(
-        """
-        <style>
-        .settings-drawer {
-            display: none;
-            position: fixed;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            width: 90%;
-            max-width: 480px;
-            max-height: 90vh;
-            background: rgba(31,31,48,0.95);
-            padding: 20px 16px;
-            overflow-y: auto;
-            z-index: 1001;
-            transition: all 0.3s ease-in-out;
-            backdrop-filter: blur(10px);
-            box-shadow: 0 4px 12px rgba(0,0,0,0.4);
-            border: 2px solid #8000ff;
-            border-radius: 6px;
-        }
-        .settings-drawer.visible {
-            display: block;
-        }
-        .settings-overlay {
-            display: none;
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100vw;
-            height: 100vh;
-            background: rgba(0,0,0,0.5);
-            z-index: 1000;
-            cursor: pointer;
-        }
-        .settings-overlay.visible {
-            display: block;
-        }
-        .settings-content {
-            margin-top: 10px;
-        }
-        .close-btn {
-            position: absolute;
-            top: 8px;
-            right: 8px;
-            background: transparent;
-            border: none;
-            color: #ffffff;
-            font-size: 20px;
-            cursor: pointer;
-        }
-        </style>
-        <script>
-        window.hideSettingsDrawer = function() {
-            const url = new URL(window.location.href);
-            url.searchParams.set('close_settings', '1');
-            window.location.href = url.toString();
-        }
-        window.addEventListener('keydown', (e) => {
-            if (e.key === 'Escape') {
-                window.hideSettingsDrawer();
-            }
-        });
-        </script>
-        """,
-        unsafe_allow_html=True,
-    )
+def _parse_csv(text):
+    """Split a comma separated text area into trimmed, non-empty items."""
+    return list(filter(None, map(str.strip, text.split(","))))
+
+
+def _parse_lines(text):
+    """Split a one-per-line text area into trimmed, non-empty items."""
+    return list(filter(None, map(str.strip, text.splitlines())))
+
+
+# Widget key for each persistent setting. Streamlit drops a widget's state
+# on any run that skips rendering it (closed drawer), so the values live in
+# the plain keys and the widgets are seeded from them on every render.
+_SETTING_WIDGET_KEYS = {
+    "test_mode": "_test_mode_widget",
+    "time_value": "_time_value_widget",
+    "time_unit": "_time_unit_widget",
+}
+
+
+def _store_setting(name):
+    """Copy a settings widget's new value into its persistent key."""
+    st.session_state[name] = st.session_state[_SETTING_WIDGET_KEYS[name]]
 
-    if "show_settings" not in st.session_state:
-        st.session_state.show_settings = False
 
-    st.markdown(
-        f"""
-        <div class="settings-overlay{'visible' if st.session_state.show_settings else ''}" onclick="window.hideSettingsDrawer();"></div>
-        <div class="settings-drawer{'visible' if st.session_state.show_settings else ''}">
-            <button class="close-btn" onclick="window.hideSettingsDrawer();">&times;</button>
-        """,
-        unsafe_allow_html=True
+def _close_drawer():
+    """Hide the drawer in place; no page navigation or query params involved."""
+    st.session_state.show_settings = False
+
+
+def render_settings_drawer():
+    """Render the settings drawer and return button states.
+
+    The drawer itself is a fragment, so its widgets only rerun the drawer.
+    Clicks that the rest of the page must react to are passed back through
+    ``st.session_state`` and returned here as ``(fetch_requested, config_saved)``.
+    """
+    _settings_drawer()
+    return (
+        st.session_state.pop("fetch_requested", False),
+        st.session_state.pop("config_saved", False),
     )
 
-    if st.session_state.show_settings:
-        with st.container():
-            st.toggle(
-                "Test Mode",
-                value=st.session_state.get('test_mode', False),
-                key="test_mode",
-                help="In Test Mode, only TechCrunch is scanned",
-            )
 
-            col1, col2 = st.columns([2, 2])
-            with col1:
-                st.number_input(
-                    "Time Period",
-                    min_value=1,
-                    step=1,
-                    key="time_value",
-                )
-            with col2:
-                unit_options = ["Days", "Weeks"]
-                st.selectbox(
-                    "Unit",
-                    unit_options,
-                    key="time_unit",
-                )
-
-            st.session_state.lookback_days = calculate_lookback_days(
-                st.session_state.time_value,
-                st.session_state.time_unit,
+@st.fragment
+def _settings_drawer():
+    """Draw the drawer contents; reruns on its own when its widgets change."""
+    st.session_state.setdefault("show_settings", False)
+    st.session_state.setdefault("is_fetching", False)
+    st.session_state.setdefault("test_mode", False)
+    st.session_state.setdefault("time_value", 1)
+    st.session_state.setdefault("time_unit", "Weeks")
+
+    # A hidden drawer emits nothing
+    if not st.session_state.show_settings:
+        return
+
+    # A stale unit would make the unit selectbox raise
+    if st.session_state.time_unit not in _UNIT_OPTIONS:
+        st.session_state.time_unit = "Weeks"
+    for name, widget_key in _SETTING_WIDGET_KEYS.items():
+        st.session_state[widget_key] = st.session_state[name]
+
+    with st.container():
+        st.button("Close", key="close_drawer", on_click=_close_drawer)
+
+        st.toggle(
+            "Test Mode",
+            key="_test_mode_widget",
+            on_change=_store_setting,
+            args=("test_mode",),
+            help="In Test Mode, only TechCrunch is scanned",
+        )
+
+        col1, col2 = st.columns([2, 2])
+        with col1:
+            st.number_input(
+                "Time Period",
+                min_value=1,
+                step=1,
+                key="_time_value_widget",
+                on_change=_store_setting,
+                args=("time_value",),
             )
-
-            fetch_button = st.button(
-                "Fetch New Articles",
-                disabled=st.session_state.get("is_fetching", False),
-                type="primary",
-                key="fetch_btn",
+        with col2:
+            st.selectbox(
+                "Unit",
+                _UNIT_OPTIONS,
+                key="_time_unit_widget",
+                on_change=_store_setting,
+                args=("time_unit",),
             )
-            if fetch_button:
-                # Hide the drawer immediately when starting a fetch
-                st.session_state.show_settings = False
-                st.markdown(
-                    "<script>window.hideSettingsDrawer && window.hideSettingsDrawer();</script>",
-                    unsafe_allow_html=True,
-                )
-
-            config_saved = False
-            with st.expander("Configuration", expanded=False):
-                from utils.config_manager import load_config, save_config
 
+        # Recompute only when the period inputs actually changed
+        lookback_inputs = (st.session_state.time_value, st.session_state.time_unit)
+        if st.session_state.get("_lookback_inputs") != lookback_inputs:
+            st.session_state.lookback_days = calculate_lookback_days(*lookback_inputs)
+            st.session_state._lookback_inputs = lookback_inputs
+
+        fetch_button = st.button(
+            "Fetch New Articles",
+            disabled=st.session_state.is_fetching,
+            type="primary",
+            key="fetch_btn",
+        )
+        if fetch_button:
+            # The fetch runs outside the fragment, so rerun the whole app
+            st.session_state.fetch_requested = True
+            st.rerun()
+
+        # The form widgets are only created while the section is shown,
+        # instead of being built on every rerun inside a collapsed expander
+        show_config = st.toggle("Show Configuration", key="_cfg_open")
+        if show_config:
+            with st.container(border=True):
+                # load_config is cached on the file's mtime and returns the
+                # shared dict, so the saves below build copies
                 config_data = load_config()
                 eval_cfg = config_data.get("evaluation", {})
 
-                st.subheader("Evaluation Criteria")
-
-                companies = st.text_area(
-                    "Companies (comma separated)",
-                    ", ".join(eval_cfg.get("companies", [])),
-                )
-                tools = st.text_area(
-                    "Tools (comma separated)",
-                    ", ".join(eval_cfg.get("tools", [])),
-                )
-                retail_terms = st.text_area(
-                    "Retail Terms (comma separated)",
-                    ", ".join(eval_cfg.get("retail_terms", [])),
-                )
-                deployment_terms = st.text_area(
-                    "Deployment Terms (comma separated)",
-                    ", ".join(eval_cfg.get("deployment_terms", [])),
-                )
-                major_platforms = st.text_area(
-                    "Major Platforms (comma separated)",
-                    ", ".join(eval_cfg.get("major_platforms", [])),
-                )
-                rubric = st.text_area(
-                    "Takeaway Rubric",
-                    config_data.get("takeaway_rubric", ""),
-                    height=150,
-                )
-
-                if st.button("Save Evaluation Configuration", key="save_config_btn"):
-                    eval_cfg["companies"] = [c.strip() for c in companies.split(",") if c.strip()]
-                    eval_cfg["tools"] = [t.strip() for t in tools.split(",") if t.strip()]
-                    eval_cfg["retail_terms"] = [r.strip() for r in retail_terms.split(",") if r.strip()]
-                    eval_cfg["deployment_terms"] = [d.strip() for d in deployment_terms.split(",") if d.strip()]
-                    eval_cfg["major_platforms"] = [m.strip() for m in major_platforms.split(",") if m.strip()]
-                    config_data["evaluation"] = eval_cfg
-                    config_data["takeaway_rubric"] = rubric
-                    save_config(config_data)
-                    config_saved = True
+                # Edits are batched until submit instead of rerunning per keystroke
+                with st.form("eval_config_form", clear_on_submit=False):
+                    st.subheader("Evaluation Criteria")
+
+                    companies = st.text_area(
+                        "Companies (comma separated)",
+                        ", ".join(eval_cfg.get("companies", [])),
+                    )
+                    tools = st.text_area(
+                        "Tools (comma separated)",
+                        ", ".join(eval_cfg.get("tools", [])),
+                    )
+                    retail_terms = st.text_area(
+                        "Retail Terms (comma separated)",
+                        ", ".join(eval_cfg.get("retail_terms", [])),
+                    )
+                    deployment_terms = st.text_area(
+                        "Deployment Terms (comma separated)",
+                        ", ".join(eval_cfg.get("deployment_terms", [])),
+                    )
+                    major_platforms = st.text_area(
+                        "Major Platforms (comma separated)",
+                        ", ".join(eval_cfg.get("major_platforms", [])),
+                    )
+                    rubric = st.text_area(
+                        "Takeaway Rubric",
+                        config_data.get("takeaway_rubric", ""),
+                        height=150,
+                    )
+
+                    submitted = st.form_submit_button(
+                        "Save Evaluation Configuration"
+                    )
+                if submitted:
+                    eval_cfg = dict(eval_cfg)
+                    eval_cfg["companies"] = _parse_csv(companies)
+                    eval_cfg["tools"] = _parse_csv(tools)
+                    eval_cfg["retail_terms"] = _parse_csv(retail_terms)
+                    eval_cfg["deployment_terms"] = _parse_csv(deployment_terms)
+                    eval_cfg["major_platforms"] = _parse_csv(major_platforms)
+                    save_config(dict(
+                        config_data, evaluation=eval_cfg, takeaway_rubric=rubric
+                    ))
+                    # Picked up by the caller on the next full rerun
+                    st.session_state.config_saved = True
                     st.success("Evaluation configuration saved.")
 
                 st.divider()
@@ -193,19 +180,19 @@ def render_settings_drawer():
                 full_default = "\n".join(config_data.get("full_scan_urls", []))
                 test_default = "\n".join(config_data.get("test_scan_urls", []))
                 
-                url_col1, url_col2 = st.columns(2)
-                with url_col1:
-                    full_text = st.text_area("Full Scan URLs", full_default, height=200, key="full_urls")
-                with url_col2:
-                    test_text = st.text_area("Test Scan URLs", test_default, height=200, key="test_urls")
-                
-                if st.button("Save URL Configuration", key="save_urls_btn"):
-                    config_data["full_scan_urls"] = [u.strip() for u in full_text.splitlines() if u.strip()]
-                    config_data["test_scan_urls"] = [u.strip() for u in test_text.splitlines() if u.strip()]
-                    save_config(config_data)
+                with st.form("url_config_form", clear_on_submit=False):
+                    url_col1, url_col2 = st.columns(2)
+                    with url_col1:
+                        full_text = st.text_area("Full Scan URLs", full_default, height=200, key="full_urls")
+                    with url_col2:
+                        test_text = st.text_area("Test Scan URLs", test_default, height=200, key="test_urls")
+                    urls_submitted = st.form_submit_button(
+                        "Save URL Configuration"
+                    )
+                if urls_submitted:
+                    save_config(dict(
+                        config_data,
+                        full_scan_urls=_parse_lines(full_text),
+                        test_scan_urls=_parse_lines(test_text),
+                    ))
                     st.success("URL configuration saved.")
-
-            
-            return fetch_button, config_saved
-
-    return None, False